@@ -2,11 +2,31 @@ import { getSql } from '../../db';
 import { NextResponse } from 'next/server';
 import { Email } from '../../types/types';
 
+// Opt-in and per-process: a POST only clears the cache of the instance that
+// handled it, and writes made outside this route are not seen at all, so other
+// instances may serve a listing up to EMAIL_CACHE_TTL_MS old. Off by default.
+const CACHE_TTL_MS = Number(process.env.EMAIL_CACHE_TTL_MS) || 0;
+
+let cachedEmails: { time: number; emails: Email[] } | null = null;
+let cacheGeneration = 0;
+
 export async function GET() {
+  if (cachedEmails && Date.now() - cachedEmails.time < CACHE_TTL_MS) {
+    return NextResponse.json(cachedEmails.emails);
+  }
+
   const sql = getSql();
-  const emails = await sql`SELECT * FROM public.emails`;
+  const generation = cacheGeneration;
+  const emails = (await sql`
+    SELECT id, inbox_type, receiver, sender, time, subject, content, tag, reply
+    FROM public.emails
+  `) as Email[];
+  // A POST that landed while this query was in flight makes the result stale.
+  if (CACHE_TTL_MS > 0 && generation === cacheGeneration) {
+    cachedEmails = { time: Date.now(), emails };
+  }
 
-  return NextResponse.json(emails as Email[]);
+  return NextResponse.json(emails);
 }
 
 export async function POST(request: Request) {
@@ -17,6 +37,8 @@ export async function POST(request: Request) {
     INSERT INTO public.emails (inbox_type, receiver, sender, time, subject, content, tag, reply)
     VALUES (${email.inbox_type}, ${email.receiver}, ${email.sender}, ${email.time}, ${email.subject}, ${email.content}, ${email.reply}, ${email.tag})
   `;
+  cacheGeneration++;
+  cachedEmails = null;
 
   return NextResponse.json({ message: 'Email uploaded' }, { status: 201 });
 }
\ No newline at end of file